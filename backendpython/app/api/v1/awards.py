@@ -10,13 +10,13 @@ failures, rate limiting, and data validation.
 from fastapi import APIRouter, HTTPException, status
 import httpx
 from app.services.awards_service import fetch_oscar_highlights
-from app.utils.validate_year import validate_year
+from app.utils.validate_year import Year
 
 
 router = APIRouter()
 
 @router.get("/year/{year}/awards")
-async def get_awards(year: int):
+async def get_awards(year: Year):
     """
     Retrieve Oscar highlights for a specific year.
 
@@ -46,7 +46,7 @@ async def get_awards(year: int):
 
     Raises:
         HTTPException:
-            - 400: Invalid year format or out of valid range
+            - 422: Invalid year format or out of valid range
             - 404: No Oscar data found for the specified year
             - 429: API rate limit exceeded
             - 502: The Awards API returned an error response
@@ -81,8 +81,6 @@ async def get_awards(year: int):
         Not all categories may be present if data is unavailable for the given year.
         Image paths may be None if TMDb lookup fails.
     """
-    validate_year(year)
-
     try:
         highlights = await fetch_oscar_highlights(year)
 
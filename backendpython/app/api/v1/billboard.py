@@ -2,14 +2,14 @@ from fastapi import APIRouter, HTTPException, status
 from app.services.artist_of_the_year import get_artist_of_the_year, add_artist_images
 from app.clients.artist_img_client import fetch_wiki_image
 from app.services.hit_song_year import get_year_with_hit_songs
-from app.utils.validate_year import validate_year
+from app.utils.validate_year import Year
 import httpx
 
 
 router = APIRouter()
 
 @router.get("/year/{year}/billboard/artist/top-songs")
-async def get_billboard_top_songs(year: int):
+async def get_billboard_top_songs(year: Year):
     """
     Retrives the top Billboard artists and their hit songs for a given year.
     
@@ -35,8 +35,6 @@ async def get_billboard_top_songs(year: int):
         - 502 BAD GATEWAY: The Billboard se.wikicap.service returned an unexpected error.
         - 503 SERVICE UNAVAILABLE: A connection error occurred when contacting the Billboard se.wikicap.service.
     """
-    validate_year(year)
-
     try:
         result = await get_year_with_hit_songs(year)
     except httpx.HTTPStatusError as e:
@@ -71,7 +69,7 @@ async def get_billboard_top_songs(year: int):
     return result
 
 @router.get("/year/{year}/billboard/artist")
-async def get_billboard_artists(year:int):
+async def get_billboard_artists(year: Year):
     """
     Retrieve Billboard's top artists for a given year.
     
@@ -100,8 +98,6 @@ async def get_billboard_artists(year:int):
         - 502 BAD GATEWAY: The BIllboard se.wikicap.service returned an unexpected error.
         - 503 SERVICE UNAVAILABLE:  A conection error occurred when contacting the Billboard se.wikicap.service.
     """
-    validate_year(year)
-
     try:
         base = await get_artist_of_the_year(year)
     except httpx.HTTPStatusError as e:
@@ -133,5 +129,5 @@ async def get_billboard_artists(year:int):
             detail=f"NOT FOUND: No Billboard data found for year {year}."
         )
 
-    return add_artist_images(base, fetch_wiki_image)
+    return await add_artist_images(base, fetch_wiki_image)
 
@@ -9,14 +9,14 @@ error handling for API failures, rate limiting, and data validation.
 from fastapi import APIRouter, HTTPException, status
 from app.services.movie_service import fetch_movies_for_year
 from app.services.movie_service import fetch_series_for_year
-from app.utils.validate_year import validate_year
+from app.utils.validate_year import Year
 import httpx
 
 
 router = APIRouter()
 
 @router.get("/year/{year}/movies")
-async def get_movies(year: int):
+async def get_movies(year: Year):
     """
     Retrieve top-rated movies for a specific year.
 
@@ -40,7 +40,7 @@ async def get_movies(year: int):
 
     Raises:
         HTTPException:
-            - 400: Invalid year format or out of valid range
+            - 422: Invalid year format or out of valid range
             - 404: No movie data found for the specified year
             - 429: TMDb API rate limit exceeded
             - 502: TMDb API returned an error response
@@ -65,8 +65,6 @@ async def get_movies(year: int):
             "source": "TMDb"
         }
     """
-    validate_year(year)
-
     try:
         movies = await fetch_movies_for_year(year)
     except httpx.HTTPStatusError as e:
@@ -101,7 +99,7 @@ async def get_movies(year: int):
     return movies
 
 @router.get("/year/{year}/series")
-async def get_series(year: int):
+async def get_series(year: Year):
     """
     Retrieve top-rated TV series for a specific year.
 
@@ -125,7 +123,7 @@ async def get_series(year: int):
 
     Raises:
         HTTPException:
-            - 400: Invalid year format or out of valid range
+            - 422: Invalid year format or out of valid range
             - 404: No series data found for the specified year
             - 429: TMDb API rate limit exceeded
             - 502: TMDb API returned an error response
@@ -155,8 +153,6 @@ async def get_series(year: int):
         to older shows, ensuring that series relevant to the queried year are
         prioritized over long-running shows that merely aired during that year.
     """
-    validate_year(year)
-
     try:
         series = await fetch_series_for_year(year)
 
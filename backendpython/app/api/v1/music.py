@@ -1,16 +1,19 @@
+import logging
 from fastapi import APIRouter, HTTPException
 import httpx
 from app.services.music_service import fetch_songs_for_year, fetch_artists_for_year
+from app.utils.validate_year import Year
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.get("/year/{year}/artists") # Används inte ännu
-def get_artists(year: int):
+async def get_artists(year: Year):
 
-    return fetch_artists_for_year(year)
+    return await fetch_artists_for_year(year)
 
 
 @router.get("/year/{year}/songs")
-def get_songs(year: int):
+async def get_songs(year: Year):
     """
     Retrieve top songs for a specific year from Spotify.
     Args:
@@ -22,15 +25,14 @@ def get_songs(year: int):
         HTTPException: Raises appropriate HTTP exceptions for various error scenarios.
     """
     try:
-        songs = fetch_songs_for_year(year)
+        songs = await fetch_songs_for_year(year)
         return songs
     
     except httpx.HTTPStatusError as error:
         status = error.response.status_code
         
         if status == 400:
-            print("Spotify status:", error.response.status_code)
-            print("Spotify body:", error.response.text)
+            logger.debug("Spotify returned %s: %s", status, error.response.text)
             raise HTTPException(
                 status_code=400,
                 detail="Invalid year parameter."
@@ -1,14 +1,12 @@
 from fastapi import APIRouter, HTTPException, status
 import httpx
 from app.services.nobel_service import get_nobel_prizes
-from app.utils.validate_year import validate_year
+from app.utils.validate_year import Year
 
 router = APIRouter()
 
 @router.get("/year/{year}/nobel")
-async def year_nobel(year: int):
-    validate_year(year)
-
+async def year_nobel(year: Year):
     try:
         nobel_prize = await get_nobel_prizes(year)
 
@@ -1,17 +1,14 @@
 from fastapi import APIRouter, HTTPException, status
 import httpx
 from app.services.wiki_service import fetch_year_summary
-from app.utils.validate_year import validate_year
+from app.utils.validate_year import Year
 
 router = APIRouter()
 
 
 
 @router.get("/year/{year}/wiki", status_code=status.HTTP_200_OK)
-async def get_year(year: int):
-    validate_year(year)
-
-
+async def get_year(year: Year):
     try:
         events = await fetch_year_summary(year)
 
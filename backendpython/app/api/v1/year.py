@@ -16,11 +16,31 @@ from app.services.artist_of_the_year import get_artist_of_the_year
 from app.services.hit_song_year import get_year_with_hit_songs
 from app.services.nobel_service import get_nobel_prizes
 from app.services.music_service import fetch_songs_for_year
+from app.core.cache import cached
+from app.utils.validate_year import Year
 
 router = APIRouter()
 
+async def fetch_billboard(year: int) -> tuple[dict, dict]:
+    """
+    Fetch the Billboard artists of a year and their hit songs.
+
+    The artist list is fetched once and reused for the hit song lookup,
+    instead of both calls scraping the same Billboard page.
+
+    Args:
+        year (int): The year to retrieve Billboard data for.
+
+    Returns:
+        tuple[dict, dict]: The artists payload and the artists with their top songs.
+    """
+    artists = await get_artist_of_the_year(year)
+    songs = await get_year_with_hit_songs(year, artists)
+    return artists, songs
+
 @router.get("/year/{year}")
-async def get_year(year: int):
+@cached("year")
+async def get_year(year: Year):
     """
     Retrieve comprehensive data for a specific year.
 
@@ -41,6 +61,7 @@ async def get_year(year: int):
             - billboard_top_artists (dict): Billboard Hot 100 chart-topping artists
             - billboard_artist_top_songs (dict): Top songs for each artist
             - nobel_prizes (dict): Nobel Prize winners for the year
+            - spotify_songs (dict): Songs released in the year from Spotify
 
     Example:
         GET /api/v1/year/2020
@@ -54,7 +75,8 @@ async def get_year(year: int):
             "series": {...},
             "billboard_top_artists": {...},
             "billboard_artist_top_songs": {...},
-            "nobel_prizes": {...}
+            "nobel_prizes": {...},
+            "spotify_songs": {...}
         }
 
     Note:
@@ -63,14 +85,14 @@ async def get_year(year: int):
         of all calls.
     """
     # Run all API calls concurrently for maximum performance
-    events, movie_highlights, movies, series, billboard_artists, billboard_songs, nobel = await asyncio.gather(
+    events, movie_highlights, movies, series, (billboard_artists, billboard_songs), nobel, spotify_songs = await asyncio.gather(
         fetch_year_summary(year),
         fetch_oscar_highlights(year),
         fetch_movies_for_year(year),
         fetch_series_for_year(year),
-        get_artist_of_the_year(year),
-        get_year_with_hit_songs(year),
-        get_nobel_prizes(year)
+        fetch_billboard(year),
+        get_nobel_prizes(year),
+        fetch_songs_for_year(year)
     )
 
     return {
@@ -82,5 +104,5 @@ async def get_year(year: int):
         "billboard_top_artists": billboard_artists,
         "billboard_artist_top_songs": billboard_songs,
         "nobel_prizes": nobel,
-        "spotify_songs": fetch_songs_for_year(year)
+        "spotify_songs": spotify_songs
     }
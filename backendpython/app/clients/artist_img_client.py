@@ -1,16 +1,20 @@
 import urllib.parse
-import httpx
+import orjson
+from app.core.http import WIKI_SEMAPHORE, build_async_client
 
 WIKI_SUMMARY = "https://en.wikipedia.org/api/rest_v1/page/summary"
 HEADERS = {"User-Agent": "WikiCap/1.0 (https://github.com/WikiCap/year-overview)"}
 
+_client = build_async_client(headers=HEADERS)
 
-def fetch_wiki_image(title:str) -> str | None:
+
+async def fetch_wiki_image(title:str) -> str | None:
     """
     Fetch the main image URL for a given Wikipedia page title.
     
     Retrieves image information from the Wikipedia summary API and returns the page's 
-    thumbnail or original image URL if available. 
+    thumbnail or original image URL if available. Images are best-effort and
+    looked up for many artists at once, so failed lookups are not retried.
     
     Parameters
     ----------
@@ -26,10 +30,11 @@ def fetch_wiki_image(title:str) -> str | None:
     safe_title = urllib.parse.quote(title.replace(" ", "_"))
     url = f"{WIKI_SUMMARY}/{safe_title}"
     
-    response = httpx.get(url, headers=HEADERS, timeout=10)
+    async with WIKI_SEMAPHORE:
+        response = await _client.get(url, timeout=10)
     response.raise_for_status()
     
-    data = response.json()
+    data = orjson.loads(response.content)
     if "thumbnail" in data and data["thumbnail"].get("source"):
         return data["thumbnail"]["source"]
     if "originalimage" in data and data["originalimage"].get("source"):
@@ -3,14 +3,46 @@ The Awards API se.wikicap.client module.
 
 This module provides async HTTP se.wikicap.client functions for interacting with The Awards API
 to retrieve Oscar (Academy Awards) data including editions, categories, and nominees.
+Results are memoized in-process for MEMO_TTL seconds, so repeated lookups
+do not go upstream again. The memo expires, so winners announced for a
+current ceremony are picked up at most MEMO_TTL after the Redis entry of the
+year is refreshed.
 
 API Documentation: https://theawards.vercel.app/api
 """
 
 import httpx
+import orjson
+from app.core.http import build_async_client
+from app.utils.async_cache import async_lru_cache
 
 BASE_AWARDS_URL = "https://theawards.vercel.app/api"
 
+_JSON_HEADERS = {"accept": "application/json"}
+
+MEMO_TTL = 60 * 5
+
+_client = build_async_client(headers=_JSON_HEADERS)
+
+
+async def _get_json(path: str, params: dict | None = None):
+    """
+    GET a path of The Awards API and decode the JSON body.
+
+    Non-2xx responses raise `httpx.HTTPStatusError` directly without decoding
+    the body; successful bodies are decoded from the raw bytes with orjson.
+    """
+    response = await _client.get(f"{BASE_AWARDS_URL}{path}", params=params)
+    if not response.is_success:
+        raise httpx.HTTPStatusError(
+            f"The Awards API returned {response.status_code} for {response.url}",
+            request=response.request,
+            response=response,
+        )
+    return orjson.loads(response.content)
+
+
+@async_lru_cache(maxsize=512, ttl=MEMO_TTL)
 async def get_oscar_edition_by_year(year: int):
     """
     Fetch Oscar edition metadata for a specific ceremony year.
@@ -37,16 +69,10 @@ async def get_oscar_edition_by_year(year: int):
         await get_oscar_edition_by_year(2020)
         [{"id": 92, "year": 2020, "date": "2020-02-09", ...}]
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_AWARDS_URL}/oscars/editions",
-            params={"year": year},
-            headers={"accept": "application/json"},
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _get_json("/oscars/editions", params={"year": year})
 
 
+@async_lru_cache(maxsize=512, ttl=MEMO_TTL)
 async def get_oscar_categories(edition_id: int):
     """
     Fetch all award categories for a specific Oscar edition.
@@ -74,15 +100,10 @@ async def get_oscar_categories(edition_id: int):
             {"id": 2, "name": "Actor In A Leading Role", ...}
         ]
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_AWARDS_URL}/oscars/editions/{edition_id}/categories",
-            headers={"accept": "application/json"},
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _get_json(f"/oscars/editions/{edition_id}/categories")
 
 
+@async_lru_cache(maxsize=4096, ttl=MEMO_TTL)
 async def get_oscar_category_details(edition_id: int, category_id: int):
     """
     Fetch nominees and winner for a specific Oscar category in an edition.
@@ -112,10 +133,4 @@ async def get_oscar_category_details(edition_id: int, category_id: int):
             {"id": 124, "name": "Leonardo DiCaprio", "winner": False, "more": "Once Upon a Time..."}
         ]
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_AWARDS_URL}/oscars/editions/{edition_id}/categories/{category_id}/nominees",
-            headers={"accept": "application/json"},
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _get_json(f"/oscars/editions/{edition_id}/categories/{category_id}/nominees")
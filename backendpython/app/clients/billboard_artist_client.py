@@ -1,10 +1,19 @@
-import httpx
+import asyncio
 import os
+import orjson
+from app.core.http import WIKI_SEMAPHORE, build_async_client, wiki_retry
 
 HEADERS = {
     "User-Agent": "WikiCap/1.0 (https://github.com/WikiCap/year-overview)"
 }
 
+_client = build_async_client(headers=HEADERS)
+
+# Wikipedia renamed the yearly lists from 2000 onwards
+BILLBOARD_URL_POST_2000 = "https://en.wikipedia.org/wiki/List_of_Billboard_Hot_100_number_ones_of_{year}"
+BILLBOARD_URL_PRE_2000 = "https://en.wikipedia.org/wiki/List_of_Billboard_Hot_100_number-one_singles_of_{year}"
+
+@wiki_retry
 async def get_billboard_page(year: int) -> str | None:
     """
     Retrieves the HTML Billboard Hot 100 Wikipedia page for a given year.
@@ -25,16 +34,11 @@ async def get_billboard_page(year: int) -> str | None:
             The HTML content of the Wikipedia page if the request succeeds,
             otherwise None.
     """
-    
-    if year >=2000:
-        url = (f"https://en.wikipedia.org/wiki/List_of_Billboard_Hot_100_number_ones_of_{year}")
-        
-    else: 
-        url = ( f"https://en.wikipedia.org/wiki/List_of_Billboard_Hot_100_number-one_singles_of_{year}")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=HEADERS, timeout=20.0, follow_redirects=True)
-        response.raise_for_status()
+    url_template = BILLBOARD_URL_POST_2000 if year >= 2000 else BILLBOARD_URL_PRE_2000
+
+    async with WIKI_SEMAPHORE:
+        response = await _client.get(url_template.format(year=year), timeout=20.0, follow_redirects=True)
+    response.raise_for_status()
 
     return response.text
 
@@ -71,11 +75,10 @@ async def get_artist_lastfm(artist_name: str, limit: int=9) ->list[str]:
         "limit": limit,
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(URL, params=params, timeout=15)
-        response.raise_for_status()
+    response = await _client.get(URL, params=params, timeout=15)
+    response.raise_for_status()
     
-    api_data = response.json()
+    api_data = orjson.loads(response.content)
     
     results = api_data.get("results")
     if results is None:
@@ -131,11 +134,10 @@ async def get_hit_song(artist: str, limit: int=5) -> list[dict]:
         "autocorrect": 1,
     }
         
-    async with httpx.AsyncClient() as client:
-        response = await client.get(URL, params=params, timeout=15)
-        response.raise_for_status()
+    response = await _client.get(URL, params=params, timeout=15)
+    response.raise_for_status()
         
-    data = response.json()
+    data = orjson.loads(response.content)
 
     top_tracks = data.get("toptracks")
     if not top_tracks:
@@ -153,3 +155,29 @@ async def get_hit_song(artist: str, limit: int=5) -> list[dict]:
         for track in tracks
         if track.get("name")
     ]
+
+
+async def get_hits_for_artists(artists: list[str], limit: int=5) -> list[list[dict] | Exception]:
+    """
+    Retrieve the hit songs of several artists concurrently.
+
+    All ``"get_hit_song"`` requests are started at once and share the pooled
+    keep-alive connections of the client, instead of running one after another.
+
+    Parameters
+    ----------
+        artists: list[str]
+            The names of the artists.
+        limit: int, optional
+            Maximum number of songs per artist. Defaults to 5.
+
+    Returns
+    -------
+        list:
+            One entry per artist, in the same order: the artist's song list
+            from ``"get_hit_song"``, or the exception raised for that artist.
+    """
+    return await asyncio.gather(
+        *[get_hit_song(artist, limit) for artist in artists],
+        return_exceptions=True
+    )
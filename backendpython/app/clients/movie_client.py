@@ -9,7 +9,8 @@ API Documentation: https://developers.themoviedb.org/3
 """
 
 from app.core import config
-import httpx
+from app.core.http import build_async_client
+import orjson
 
 BASE_URL = "https://api.themoviedb.org/3"
 HEADERS = {
@@ -17,6 +18,8 @@ HEADERS = {
     "Authorization": "Bearer " + config.TMDB_API_KEY,
 }
 
+_client = build_async_client(headers=HEADERS)
+
 async def get_top_movies_by_year(year: int):
     """
     Fetch top-rated movies for a specific release year from TMDb.
@@ -46,18 +49,16 @@ async def get_top_movies_by_year(year: int):
         await get_top_movies_by_year(2020)
         {"results": [...], "page": 1, "total_results": 42, ...}
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/discover/movie",
-            headers=HEADERS,
-            params={
-                "primary_release_year": year,
-                "sort_by": "vote_count.desc",
-                "vote_average.gte": 7,
-                "vote_count.gte": 1000,
-            }
-        )
-        return response.json()
+    response = await _client.get(
+        f"{BASE_URL}/discover/movie",
+        params={
+            "primary_release_year": year,
+            "sort_by": "vote_count.desc",
+            "vote_average.gte": 7,
+            "vote_count.gte": 1000,
+        }
+    )
+    return orjson.loads(response.content)
 
 
 async def get_top_series_by_year(year: int):
@@ -90,20 +91,18 @@ async def get_top_series_by_year(year: int):
         await get_top_series_by_year(2020)
         {"results": [...], "page": 1, "total_results": 38, ...}
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/discover/tv",
-            headers=HEADERS,
-            params={
-                "air_date.gte": f"{year}-01-01",
-                "air_date.lte": f"{year}-12-31",
-                "sort_by": "popularity.desc",
-                "vote_count.gte": 1000,
-                "vote_average.gte": 7,
-                "include_null_first_air_dates": False,
-            }
-        )
-        return response.json()
+    response = await _client.get(
+        f"{BASE_URL}/discover/tv",
+        params={
+            "air_date.gte": f"{year}-01-01",
+            "air_date.lte": f"{year}-12-31",
+            "sort_by": "popularity.desc",
+            "vote_count.gte": 1000,
+            "vote_average.gte": 7,
+            "include_null_first_air_dates": False,
+        }
+    )
+    return orjson.loads(response.content)
 
 
 async def search_movie_by_title(title: str, year: int | None = None):
@@ -145,14 +144,12 @@ async def search_movie_by_title(title: str, year: int | None = None):
     if year:
         params["year"] = year
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/search/movie",
-            headers=HEADERS,
-            params=params,
-        )
-        results = response.json().get("results", [])
-        return results[0] if results else None
+    response = await _client.get(
+        f"{BASE_URL}/search/movie",
+        params=params,
+    )
+    results = orjson.loads(response.content).get("results", [])
+    return results[0] if results else None
 
 
 async def search_person_by_name(name: str):
@@ -187,14 +184,12 @@ async def search_person_by_name(name: str):
         await search_person_by_name("NonexistentActor12345")
         None
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/search/person",
-            headers=HEADERS,
-            params={
-                "query": name,
-                "include_adult": False,
-            }
-        )
-        results = response.json().get("results", [])
-        return results[0] if results else None
+    response = await _client.get(
+        f"{BASE_URL}/search/person",
+        params={
+            "query": name,
+            "include_adult": False,
+        }
+    )
+    results = orjson.loads(response.content).get("results", [])
+    return results[0] if results else None
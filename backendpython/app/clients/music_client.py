@@ -1,7 +1,10 @@
+import asyncio
 import base64
-import json
+import logging
+import orjson
+import time
 from app.core import config
-import httpx
+from app.core.http import PerLoop, build_async_client
 
 SPOTIFY_BASE_URL = "https://api.spotify.com/v1/search"
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
@@ -9,30 +12,46 @@ SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 spotify_client_id = config.SPOTIFY_CLIENT_ID
 spotify_client_secret = config.SPOTIFY_CLIENT_SECRET
 
-def get_spotify_token():
+_client = build_async_client()
+logger = logging.getLogger(__name__)
+
+TOKEN_REFRESH_MARGIN = 60
+
+_token_cache: tuple[str, float] | None = None
+_token_lock = PerLoop(asyncio.Lock)
+
+async def get_spotify_token():
     """
     Retrieves an access token from the Spotify API using se.wikicap.client credentials.
     Token is required for making authorized requests to Spotify endpoints.
-    Token is valid for 1 hour.
+    Token is valid for 1 hour, so it is cached in-process and only refreshed
+    when it is within TOKEN_REFRESH_MARGIN seconds of expiring.
     
     Returns: 
         json: Access token string.
     """
+    global _token_cache
 
-    auth_string = f"{spotify_client_id}:{spotify_client_secret}"
-    auth_base64 = base64.b64encode(auth_string.encode()).decode()
-    
-    response = httpx.post(
-        SPOTIFY_TOKEN_URL,
-        headers={
-            "Authorization": f"Basic {auth_base64}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        },
-        data={"grant_type": "client_credentials"}
-    )
-    response.raise_for_status()
+    async with _token_lock:
+        if _token_cache and time.monotonic() < _token_cache[1] - TOKEN_REFRESH_MARGIN:
+            return _token_cache[0]
+
+        auth_string = f"{spotify_client_id}:{spotify_client_secret}"
+        auth_base64 = base64.b64encode(auth_string.encode()).decode()
+        
+        response = await _client.post(
+            SPOTIFY_TOKEN_URL,
+            headers={
+                "Authorization": f"Basic {auth_base64}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={"grant_type": "client_credentials"}
+        )
+        response.raise_for_status()
 
-    return response.json()["access_token"]
+        data = orjson.loads(response.content)
+        _token_cache = (data["access_token"], time.monotonic() + data.get("expires_in", 3600))
+        return _token_cache[0]
 
 def get_auth_header(token):
     """
@@ -46,7 +65,7 @@ def get_auth_header(token):
     spotify_token = token
     return {"Authorization": f"Bearer {spotify_token}"}
 
-def get_artists_by_year(year: int, token):
+async def get_artists_by_year(year: int, token):
     """
     Fetches artists from Spotify released in a specific year.
     Args:
@@ -56,7 +75,7 @@ def get_artists_by_year(year: int, token):
         list: A list of artist items from Spotify.
     """
 
-    response = httpx.get(
+    response = await _client.get(
         SPOTIFY_BASE_URL,
         headers=token,
         params={
@@ -66,9 +85,9 @@ def get_artists_by_year(year: int, token):
         }
     )
     
-    return response.json()["artists"]["items"]
+    return orjson.loads(response.content)["artists"]["items"]
 
-def get_songs_by_year(year: int, headers):
+async def get_songs_by_year(year: int, headers):
     """
     Fetches songs from Spotify released in a specific year.
     Args:
@@ -78,7 +97,7 @@ def get_songs_by_year(year: int, headers):
         list: A list of song items from Spotify.
     """
 
-    response = httpx.get(
+    response = await _client.get(
         SPOTIFY_BASE_URL,
         headers=headers,
         params={
@@ -89,9 +108,9 @@ def get_songs_by_year(year: int, headers):
     )
     response.raise_for_status()
 
-    songs = response.json()["tracks"]["items"]
+    songs = orjson.loads(response.content)["tracks"]["items"]
     if not songs:
-        print("No songs found for the given year.")
+        logger.debug("No Spotify songs found for year %s", year)
         return []
     
     return songs
\ No newline at end of file
@@ -1,4 +1,6 @@
 import httpx
+import orjson
+from app.core.http import WIKI_SEMAPHORE, build_async_client, wiki_retry
 
 WIKI_API = "https://en.wikipedia.org/w/api.php"
 
@@ -9,55 +11,24 @@ HEADERS = {
 
 TIMEOUT = httpx.Timeout(10.0, connect=5.0)
 
+_client = build_async_client(headers=HEADERS, timeout=TIMEOUT)
 
 
-async def fetch_year_toc(client: httpx.AsyncClient, year: int) -> list[dict]:
-    """
-    Fetches the wikipedia table of contents for a given year.
-
-    This function uses Mediawiki "parse" endpoint with "prop=tocdata" to
-    retrieve sections of information available on the Wikipedia page for the specified year.
-    This can be used to identify correct section indexes for later calls,
-
-    Args:
-        client (httpx.AsyncClient): An instance of httpx AsyncClient for making requests.
-        year (int): The year for which to fetch the table of contents.
-
-    Returns:
-        list[dict]: A list of section dictionaries representing the table of contents.
-        Returns an empty list if no sections are found.
-
-        Raises:
-            httpx.HTTPStatusError: If the HTTP request returns an unsuccessful status code.
-            httpx.RequestError: If there is an issue making the HTTP request.
-        """
-    params = {
-        "action": "parse",
-        "page": str(year),
-        "prop": "tocdata",
-        "format": "json",
-        "formatversion": "2",
-    }
-    request_response = await client.get(WIKI_API, params = params)
-    request_response.raise_for_status()
-
-    return request_response.json().get("parse", {}).get("tocdata", [])
 
-async def get_month_wikitext(client: httpx.AsyncClient, year: int, month_index: str) -> str:
+@wiki_retry
+async def fetch_year_wikitext(year: int) -> str:
     """
-    Fetch raw wikitext for a specific section of the wikipedia year page
+    Fetch the raw wikitext of the whole Wikipedia year page in one request.
 
-    The section is identified by its index in the table of contents., example:
-    "month_index" typically taken from the TOC data fetched via fetch_year_toc function.
+    The page is sliced into month sections locally, so a single request
+    covers the whole year.
 
     Args:
-        client: An initialized `httpx.AsyncClient` used to make the request.
         year: The year (e.g. 1997) whose Wikipedia page should be queried.
-        month_index: The section index for the month/section to fetch.
 
     Returns:
-        The raw wikitext content of the specified month/section as a string.
-        Returns an empty string if the section is not found.
+        The raw wikitext of the page as a string.
+        Returns an empty string if the page has no wikitext.
 
     Raises:
         httpx.HTTPStatusError: If the HTTP request returns an unsuccessful status code.
@@ -67,12 +38,12 @@ async def get_month_wikitext(client: httpx.AsyncClient, year: int, month_index:
         "action": "parse",
         "page": str(year),
         "prop": "wikitext",
-        "section": month_index,
         "format": "json",
         "formatversion": "2",
     }
 
-    request_response = await client.get(WIKI_API, params=params)
+    async with WIKI_SEMAPHORE:
+        request_response = await _client.get(WIKI_API, params=params)
     request_response.raise_for_status()
 
-    return request_response.json().get("parse", {}).get("wikitext", "")
\ No newline at end of file
+    return orjson.loads(request_response.content).get("parse", {}).get("wikitext", "")
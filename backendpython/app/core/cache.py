@@ -0,0 +1,178 @@
+"""Redis response cache for year-based data.
+
+Data about historical years almost never changes, so finished payloads are
+stored in Redis under ``{prefix}:{year}``. A second "stale" copy without an
+expiry is kept next to it, so the last known good payload can still be served
+when an upstream source (Wikipedia, The Awards API, ...) is unreachable.
+The ETag of each fresh payload is written under ``etag:{prefix}:{year}`` in
+the same transaction and with the same TTL, so the tag never outlives the
+payload it describes (see `app.core.etag`).
+
+Caching is disabled when REDIS_URL is not configured, and Redis errors never
+fail a request: the wrapped function simply runs uncached. Socket timeouts are
+kept short so an unreachable Redis host degrades to a cache miss instead of
+stalling the request. The Redis server is expected to run with
+``maxmemory-policy allkeys-lfu`` so rarely requested years are evicted first.
+"""
+
+import asyncio
+import datetime
+import functools
+import hashlib
+import logging
+from collections.abc import Callable
+from typing import Any
+import httpx
+import orjson
+import redis.asyncio as redis
+from app.core import config
+
+logger = logging.getLogger(__name__)
+
+HISTORICAL_TTL = 60 * 60 * 24
+RECENT_TTL = 60 * 10
+REDIS_TIMEOUT = 0.5
+
+_REDIS_ERRORS = (redis.RedisError, OSError, asyncio.TimeoutError)
+
+_redis = (
+    redis.from_url(
+        config.REDIS_URL,
+        socket_connect_timeout=REDIS_TIMEOUT,
+        socket_timeout=REDIS_TIMEOUT,
+    )
+    if config.REDIS_URL
+    else None
+)
+
+
+def ttl_for_year(year: int) -> int:
+    """
+    Pick a cache TTL for a year.
+
+    Years that are over get a long TTL, the current and previous year a short
+    one since their pages are still being edited.
+
+    Args:
+        year (int): The year the cached data belongs to.
+
+    Returns:
+        int: TTL in seconds.
+    """
+    if year < datetime.date.today().year - 1:
+        return HISTORICAL_TTL
+    return RECENT_TTL
+
+
+async def cache_get(key: str) -> bytes | None:
+    """
+    Read a raw value from Redis.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        bytes | None: The stored value, or None on a miss, when caching is
+        disabled or when Redis is unavailable.
+    """
+    if _redis is None:
+        return None
+    try:
+        return await _redis.get(key)
+    except _REDIS_ERRORS as e:
+        logger.warning("Redis GET %s failed: %s", key, e)
+        return None
+
+
+def etag_for(body: bytes) -> str:
+    """
+    Compute a strong, quoted ETag for a serialized payload.
+
+    Args:
+        body (bytes): The serialized payload or response body.
+
+    Returns:
+        str: The ETag, e.g. ``"3f2a..."``.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """
+    Store a payload in Redis together with its ETag and a stale copy.
+
+    The payload and its ``etag:{key}`` expire together after ``ttl``; the
+    ``stale:{key}`` fallback copy does not expire.
+
+    Args:
+        key (str): The cache key.
+        value (bytes): The serialized payload.
+        ttl (int): Expiry of the fresh entry and its ETag in seconds.
+    """
+    if _redis is None:
+        return
+    try:
+        async with _redis.pipeline(transaction=True) as pipe:
+            pipe.setex(key, ttl, value)
+            pipe.setex(f"etag:{key}", ttl, etag_for(value))
+            pipe.set(f"stale:{key}", value)
+            await pipe.execute()
+    except _REDIS_ERRORS as e:
+        logger.warning("Redis SET %s failed: %s", key, e)
+
+
+def cached(prefix: str, ttl: int | None = None, should_cache: Callable[[Any], bool] = bool):
+    """
+    Cache the JSON result of an async function taking ``year`` first.
+
+    The cache key is ``{prefix}:{year}``. Other arguments would not be part
+    of the key, so calling the wrapped function with anything besides
+    ``year`` raises TypeError instead of returning data cached for different
+    arguments. Empty results are not cached. If the function raises an httpx error and
+    a stale copy exists, the stale copy is returned instead.
+
+    Args:
+        prefix (str): Key prefix, unique per cached function.
+        ttl (int | None): Fixed TTL in seconds. Defaults to `ttl_for_year`.
+        should_cache (Callable[[Any], bool]): Decides whether a result is worth
+            caching. Defaults to truthiness; pass a custom predicate for
+            functions that wrap empty data in a non-empty payload.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(year: int, *args, **kwargs):
+            if args or kwargs:
+                raise TypeError(
+                    f"{func.__qualname__} is cached per year and takes no other arguments"
+                )
+            key = f"{prefix}:{year}"
+
+            hit = await cache_get(key)
+            if hit is not None:
+                return orjson.loads(hit)
+
+            try:
+                result = await func(year)
+            except httpx.HTTPError:
+                stale = await cache_get(f"stale:{key}")
+                if stale is None:
+                    raise
+                logger.warning("Serving stale cache entry for %s", key)
+                return orjson.loads(stale)
+
+            if should_cache(result):
+                await cache_set(key, orjson.dumps(result), ttl or ttl_for_year(year))
+            return result
+        return wrapper
+    return decorator
+
+
+async def close_cache() -> None:
+    """
+    Close the Redis connection pool, if caching is enabled.
+    """
+    if _redis is not None:
+        await _redis.aclose()
@@ -3,6 +3,7 @@
 Loads environment variables from the project .env file (two directories up) and
 raises clear errors when required keys are missing. Exposes TMDB, LastFM, and
 Spotify credentials as module-level constants for import by clients/services.
+REDIS_URL is optional; response caching is disabled when it is not set.
 """
 
 import os
@@ -15,6 +16,7 @@ TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 LASTFM_API_KEY=os.getenv("LASTFM_API_KEY")
 SPOTIFY_CLIENT_ID=os.getenv("SPOTIFY_CLIENT_ID")
 SPOTIFY_CLIENT_SECRET=os.getenv("SPOTIFY_CLIENT_SECRET")
+REDIS_URL=os.getenv("REDIS_URL")
 
 if not TMDB_API_KEY:
     raise RuntimeError("TMDB_API_KEY is missing in the environment")
@@ -0,0 +1,101 @@
+"""ETag support for the year endpoints.
+
+Only the year routes whose body is built from a single `@cached` payload get
+ETags: the aggregate /api/v1/year/{year}, its /wiki summary and its /awards
+highlights. They also get a Cache-Control header matching the cache TTL of
+the year. When the client sends a matching If-None-Match (weak comparison,
+``*`` included), an empty 304 is returned instead of the body. Routes whose
+body changes between requests, such as the random Spotify /songs sample,
+are passed through untouched.
+
+The ETag of a route is the ``etag:{prefix}:{year}`` tag that `cached` writes
+together with the payload, so a revalidation request whose tag is still
+current is answered with 304 without running the endpoint, and the tag
+expires with the payload it was computed from. When no tag is stored
+(caching disabled, or an empty or stale payload), the ETag is computed from
+the response body instead and nothing is written.
+"""
+
+import re
+from fastapi import Request, Response
+from app.core.cache import cache_get, etag_for, ttl_for_year
+
+# Route suffix under /api/v1/year/{year} -> `cached` prefix of its payload
+CACHED_ROUTES = {
+    "": "year",
+    "/wiki": "wiki:summary",
+    "/awards": "oscars",
+}
+
+ETAG_PATH = re.compile(
+    r"^/api/v1/year/(\d+)(" + "|".join(re.escape(suffix) for suffix in CACHED_ROUTES if suffix) + r")?$"
+)
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Compare If-None-Match against an ETag using weak comparison (RFC 9110).
+
+    ``*`` matches any current representation, and a ``W/`` prefix on either
+    side is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == opaque for tag in if_none_match.split(","))
+
+
+async def _stored_etag(key: str) -> str | None:
+    stored = await cache_get(key)
+    return stored.decode() if stored is not None else None
+
+
+async def etag_middleware(request: Request, call_next):
+    """
+    Attach ETags to cached year responses and answer revalidations with 304.
+
+    Args:
+        request (Request): The incoming request.
+        call_next (Callable): The next ASGI handler in the chain.
+
+    Returns:
+        Response: The endpoint response with ETag and Cache-Control headers,
+        or an empty 304 Not Modified response.
+    """
+    match = ETAG_PATH.match(request.url.path)
+    if request.method != "GET" or match is None:
+        return await call_next(request)
+
+    year = int(match.group(1))
+    key = f"etag:{CACHED_ROUTES[match.group(2) or '']}:{year}"
+    headers = {"Cache-Control": f"public, max-age={ttl_for_year(year)}"}
+    if_none_match = request.headers.get("If-None-Match")
+
+    stored_etag = await _stored_etag(key)
+    if stored_etag is not None and _etag_matches(if_none_match, stored_etag):
+        return Response(status_code=304, headers={"ETag": stored_etag, **headers})
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    # The endpoint may have just cached its payload and written a new tag
+    etag = await _stored_etag(key) or etag_for(body)
+
+    headers["ETag"] = etag
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    new_response = Response(content=body, status_code=response.status_code)
+    # Copy the raw header list so repeated headers (e.g. set-cookie) survive
+    new_response.raw_headers = list(response.raw_headers)
+    new_response.headers.update(headers)
+    return new_response
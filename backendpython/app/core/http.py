@@ -0,0 +1,136 @@
+"""Shared outbound HTTP client factory.
+
+Each client module builds its own module-level httpx client through this
+helper instead of opening a new client per call. Connections are pooled and
+kept alive, so repeated requests to the same host (Wikipedia, TMDb, Last.fm,
+...) skip the TCP and TLS handshake after the first call. HTTP/2 is negotiated
+where the server supports it (Wikipedia, Spotify), so concurrent requests to
+one host are multiplexed over a single connection.
+
+Clients are closed on application shutdown via `close_clients`. The
+underlying httpx client is opened lazily on first use, so a module-level
+client can be used again after shutdown (e.g. when the app is started more
+than once in the same process, as test suites do).
+
+Wikipedia calls additionally share `WIKI_SEMAPHORE`, which caps how many
+requests are in flight at once, and `wiki_retry`, which retries rate-limited
+and server-error responses with exponential backoff.
+
+asyncio locks and semaphores bind to the event loop that first waits on them,
+so module-level ones are wrapped in `PerLoop`, which creates one per running
+loop.
+"""
+
+import asyncio
+import weakref
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+
+WIKI_CONCURRENCY = 8
+
+
+class PerLoop:
+    """
+    Module-level asyncio lock or semaphore, created per running event loop.
+
+    Used as ``async with``, like the wrapped primitive. A plain asyncio
+    primitive created at import time binds to the first loop that waits on
+    it and fails in any other loop (e.g. when the app is started again).
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._primitives = weakref.WeakKeyDictionary()
+
+    def _primitive(self):
+        loop = asyncio.get_running_loop()
+        primitive = self._primitives.get(loop)
+        if primitive is None:
+            primitive = self._primitives[loop] = self._factory()
+        return primitive
+
+    async def __aenter__(self):
+        return await self._primitive().__aenter__()
+
+    async def __aexit__(self, *exc_info):
+        return await self._primitive().__aexit__(*exc_info)
+
+
+WIKI_SEMAPHORE = PerLoop(lambda: asyncio.Semaphore(WIKI_CONCURRENCY))
+
+_async_clients: list["SharedAsyncClient"] = []
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Return True for HTTP errors worth retrying (429 and 5xx).
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    code = exc.response.status_code
+    return code == 429 or code >= 500
+
+
+wiki_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.2, max=2),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+
+class SharedAsyncClient:
+    """
+    Module-level handle to a pooled `httpx.AsyncClient`.
+
+    Attribute access (``get``, ``post``, ``stream``, ...) is forwarded to the
+    underlying client, which is created on first use and created again after
+    it has been closed.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._client: httpx.AsyncClient | None = None
+
+    def __getattr__(self, name: str):
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(http2=True, limits=LIMITS, **self._kwargs)
+        return getattr(self._client, name)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying client, if it has been opened.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def build_async_client(**kwargs) -> SharedAsyncClient:
+    """
+    Create a pooled keep-alive async client with HTTP/2 enabled.
+
+    Args:
+        **kwargs: Extra keyword arguments passed to `httpx.AsyncClient`
+            (e.g. headers, timeout).
+
+    Returns:
+        SharedAsyncClient: A lazily opened client registered for closing on shutdown.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    client = SharedAsyncClient(**kwargs)
+    _async_clients.append(client)
+    return client
+
+
+async def close_clients() -> None:
+    """
+    Close every async client created with `build_async_client`.
+
+    Each client is opened again on its next use.
+    """
+    for client in _async_clients:
+        await client.aclose()
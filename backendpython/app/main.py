@@ -1,10 +1,14 @@
-import base64
 from dotenv import load_dotenv
-import os
 load_dotenv()
 
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.http import close_clients
+from app.core.cache import close_cache
+from app.core.etag import etag_middleware
 from app.api.v1.year import router as year_router
 from app.api.v1.movies import router as movies_router
 from app.api.v1.awards import router as awards_router
@@ -13,7 +17,19 @@ from app.api.v1.nobel import router as nobel_router
 from app.api.v1.billboard import router as billboard_router
 from app.api.v1.music import router as music_router
 
-app = FastAPI()
+# httpx logs every outbound request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_clients()
+    await close_cache()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Registered before CORS so CORS headers are also added to 304 responses
+app.middleware("http")(etag_middleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,7 +48,7 @@ app.include_router(wiki_router, prefix="/api/v1")
 app.include_router(nobel_router, prefix="/api/v1")
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {
         "message": "WikiCap API is running!",
     }
@@ -1,8 +1,10 @@
+import asyncio
 import re
 from bs4 import BeautifulSoup
 from app.clients.billboard_artist_client import get_billboard_page
 from app.clients.artist_img_client import fetch_wiki_image
-from typing import Callable
+from app.core.cache import cached
+from typing import Awaitable, Callable
 
 
 def find_artist_column(table_data: list[str]) -> int| None:
@@ -31,6 +33,7 @@ def find_artist_column(table_data: list[str]) -> int| None:
     return None    
         
   
+@cached("billboard:artists", should_cache=lambda payload: bool(payload["artists"]))
 async def get_artist_of_the_year(year: int) -> dict:
     """
     Extracts artist names from the Billboard Hot 100 Wikipedia Page for a given year.
@@ -49,6 +52,7 @@ async def get_artist_of_the_year(year: int) -> dict:
         dict: 
             A dictionary containing the year, a list of extracted artist names.
             If no suitable table or artist column is found, the ``"artists"`` list will be empty.
+            Such empty payloads are not cached.
     """
     html = await get_billboard_page(year)
 
@@ -109,19 +113,19 @@ async def get_artist_of_the_year(year: int) -> dict:
     }
     
     
-def add_artist_images( year_data: dict, fetch_image: Callable[[str], str | None]) -> dict: 
+async def add_artist_images( year_data: dict, fetch_image: Callable[[str], Awaitable[str | None]]) -> dict: 
     """
     Add image URLs to each artist in the provided year-data. 
     
-    This function iterates through the list of artists in ``"year_data"`` and uses the 
-    ``"fetch_image"`` callable to look up an image URL for each artist. 
-    It also has a simple cache in-memory to avoid fetching the same artist image multiple times. 
+    This asynchronous function uses the ``"fetch_image"`` coroutine to look up an image URL 
+    for each artist in ``"year_data"``. Each unique artist is looked up once and all lookups 
+    run concurrently. 
     
     Parameters
     ---------- 
         year_data: dict
             A dicitionary that includes an ``"artist_list"``.
-        fetch_image: Callable[[str], str| None]
+        fetch_image: Callable[[str], Awaitable[str| None]]
             Returns an image URL for an artist or None.
              
     Returns
@@ -131,21 +135,23 @@ def add_artist_images( year_data: dict, fetch_image: Callable[[str], str | None]
     """
     artist_list = year_data.get("artists", []) 
     
-    image_cache = {}
-    
-    artists_with_images = []
+    unique_artists = list(dict.fromkeys(artist_list))
+    images = await asyncio.gather(
+        *[fetch_image(artist_name) for artist_name in unique_artists],
+        return_exceptions=True
+    )
+    image_cache = {
+        artist_name: None if isinstance(image, Exception) else image
+        for artist_name, image in zip(unique_artists, images)
+    }
     
-    for artist_name in artist_list: 
-        if artist_name not in image_cache:
-           try:
-               image_cache[artist_name] = fetch_image(artist_name)
-           except Exception:
-               image_cache[artist_name] = None
-               
-        artists_with_images.append({
-                "name": artist_name,
-                "image": image_cache[artist_name]
-        })  
+    artists_with_images = [
+        {
+            "name": artist_name,
+            "image": image_cache[artist_name]
+        }
+        for artist_name in artist_list
+    ]
         
     result = dict(year_data)
     result["artists_with_images"] = artists_with_images
@@ -12,6 +12,7 @@ from app.clients.awards_client import (
     get_oscar_category_details
 )
 from app.clients.movie_client import search_movie_by_title, search_person_by_name
+from app.core.cache import cached
 import asyncio
 import re
 
@@ -50,6 +51,7 @@ def extract_movie_title(more_field: str) -> str:
     return title.strip()
 
 
+@cached("oscars")
 async def fetch_oscar_highlights(year: int):
     """
     Fetch Oscar winners for major categories and enrich with TMDb images.
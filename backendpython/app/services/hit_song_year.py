@@ -1,20 +1,22 @@
 from app.services.artist_of_the_year import get_artist_of_the_year
-from app.clients.billboard_artist_client import get_hit_song
-import asyncio
+from app.clients.billboard_artist_client import get_hits_for_artists
 
           
-async def get_year_with_hit_songs(year: int) -> dict:
+async def get_year_with_hit_songs(year: int, artists_payload: dict | None = None) -> dict:
     """
     Combine the artists of a given year with their top songs. 
     
     This asynchronous function retrieves the list of artist for the specified year 
-    using ``"get_artrist_of_the_year"`` function. 
-    And then feches each artist's top hit songs using ``"get_hit_song"`` function. 
+    using ``"get_artrist_of_the_year"`` function, unless it is passed in. 
+    And then feches all artists' top hit songs concurrently using ``"get_hits_for_artists"`` function. 
     
     Parameters
     ----------
         year: int
             The year for which artists and songs to be retrieved.
+        artists_payload: dict, optional
+            An already fetched result of ``"get_artist_of_the_year"``, 
+            so the Billboard page is not fetched a second time.
 
     Returns
     -------
@@ -23,7 +25,8 @@ async def get_year_with_hit_songs(year: int) -> dict:
             If no artists are found, the ``"artists"`` list will be empty.
     """   
    
-    artists_payload = await get_artist_of_the_year(year)
+    if artists_payload is None:
+        artists_payload = await get_artist_of_the_year(year)
 
     # Plocka ut själva listan med artistnamn
     artist_names = artists_payload.get("artists", []) if isinstance(artists_payload, dict) else artists_payload
@@ -33,22 +36,13 @@ async def get_year_with_hit_songs(year: int) -> dict:
         "artists": []
     }
 
-    async def fetch_artist_songs(name: str):
-        top_songs = await get_hit_song(name, 5)
-        if not top_songs:
-            return None
-        return {
-            "artist": name,
-            "top_tracks": top_songs
-        }
+    hits = await get_hits_for_artists(artist_names, 5)
 
-    artist_results = await asyncio.gather(
-        *[fetch_artist_songs(name) for name in artist_names],
-        return_exceptions=True
-    )
-
-    for artist_data in artist_results:
-        if artist_data and not isinstance(artist_data, Exception):
-            result["artists"].append(artist_data)
+    for name, top_songs in zip(artist_names, hits):
+        if top_songs and not isinstance(top_songs, Exception):
+            result["artists"].append({
+                "artist": name,
+                "top_tracks": top_songs
+            })
 
     return result
@@ -1,10 +1,11 @@
 from app.clients.music_client import get_spotify_token, get_auth_header, get_songs_by_year, get_artists_by_year
-import base64
-import httpx
+import logging
 import random
 
+logger = logging.getLogger(__name__)
 
-def fetch_songs_for_year(year: int):
+
+async def fetch_songs_for_year(year: int):
     """
     Fetches relevant songs from Spotify for a specific year.
     Args:
@@ -13,9 +14,9 @@ def fetch_songs_for_year(year: int):
         dict: A dictionary containing the year and a list of top songs.
     """
 
-    token = get_spotify_token()
+    token = await get_spotify_token()
     auth_header = get_auth_header(token)
-    raw = get_songs_by_year(year, auth_header)
+    raw = await get_songs_by_year(year, auth_header)
 
     raw = sorted(
     raw,
@@ -42,7 +43,7 @@ def fetch_songs_for_year(year: int):
         "source": "Spotify"
     }
 
-def fetch_artists_for_year(year: int): # Används inte
+async def fetch_artists_for_year(year: int): # Används inte
     """
     Fetches relevant artists from Spotify for a specific year.
     Args:
@@ -51,10 +52,10 @@ def fetch_artists_for_year(year: int): # Används inte
         dict: A dictionary containing the year and a list of top artists.
     """
 
-    print("Spotify fetch artists)")
-    token = get_spotify_token()
+    logger.debug("Fetching Spotify artists for %s", year)
+    token = await get_spotify_token()
     auth_header = get_auth_header(token)
-    raw = get_artists_by_year(year, auth_header)
+    raw = await get_artists_by_year(year, auth_header)
 
     artists = []
     for item in raw:
@@ -1,4 +1,5 @@
-import httpx
+import ijson
+from app.core.http import WIKI_SEMAPHORE, build_async_client, wiki_retry
 from app.utils.wiki_nobel_extractor import extract_nobel
 
 WIKI_API = "https://en.wikipedia.org/w/api.php"
@@ -9,13 +10,58 @@ HEADERS = {
     "Accept-Language": "en",
 }
 
+_client = build_async_client(headers=HEADERS, timeout=20)
+
+
+@wiki_retry
+async def fetch_nobel_html(year: int) -> str:
+    """
+    Fetch the rendered HTML of the "{year}_Nobel_Prizes" Wikipedia page.
+
+    The response is streamed through ijson and only "parse.text" is pulled
+    out of it, so the full JSON body is never buffered or decoded into a dict.
+    The HTML itself is still returned as one string, since ijson only yields
+    complete values.
+
+    Args:
+        year (int): The year for which to fetch the Nobel Prize page.
+
+    Returns:
+        str: The page HTML, or an empty string if the page does not exist.
+
+    Raises:
+        httpx.HTTPStatusError: If the HTTP request returns an unsuccessful status code.
+        httpx.RequestError: If there is an issue making the HTTP request.
+    """
+    params = {
+        "action": "parse",
+        "page": f"{year}_Nobel_Prizes",
+        "prop": "text",
+        "format": "json",
+        "formatversion": "2",
+    }
+
+    texts = ijson.sendable_list()
+    parser = ijson.items_coro(texts, "parse.text")
+
+    async with WIKI_SEMAPHORE:
+        async with _client.stream("GET", WIKI_API, params=params) as r:
+            r.raise_for_status()
+            async for chunk in r.aiter_bytes():
+                parser.send(chunk)
+    parser.close()
+
+    return (texts[0] if texts else "") or ""
+
+
 async def get_nobel_prizes(year: int) -> dict:
     """
     Fetch nobel prize lauureates for a given year and extract structured data.
 
     This function requests the wikipedia page "{year}_Nobel_Prizes" using
-    mediawiki "parse" endpoint with "prop=text", then parses the returned
-    HTML to extract Nobel Prize laureates using the extract_nobel utility function.
+    mediawiki "parse" endpoint with "prop=text" (see fetch_nobel_html), then
+    parses that HTML to extract Nobel Prize laureates using the extract_nobel
+    utility function.
 
     Args:
         year (int): The year for which to fetch Nobel Prize data.
@@ -34,22 +80,7 @@ async def get_nobel_prizes(year: int) -> dict:
         httpx.HTTPStatusError: If the HTTP request returns an unsuccessful status code.
         httpx.RequestError: If there is an issue making the HTTP request.
     """
-    title = f"{year}_Nobel_Prizes"
-
-    params = {
-        "action": "parse",
-        "page": title,
-        "prop": "text",
-        "format": "json",
-        "formatversion": "2",
-    }
-
-    async with httpx.AsyncClient() as client:
-        r = await client.get(WIKI_API, params=params, headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-
-    html = (data.get("parse", {}).get("text") or "")
+    html = await fetch_nobel_html(year)
 
     prizes = extract_nobel(html)
     return {
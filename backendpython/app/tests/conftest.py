@@ -0,0 +1,50 @@
+import pytest
+from app.core import cache
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    def set(self, key, value):
+        self.commands.append((key, None, value))
+
+    async def execute(self):
+        for key, ttl, value in self.commands:
+            self.store.data[key] = value.encode() if isinstance(value, str) else value
+            self.store.ttls[key] = ttl
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    # Never talk to a Redis configured through the developer's .env
+    monkeypatch.setattr(cache, "_redis", None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_redis", fake)
+    return fake
@@ -0,0 +1,104 @@
+import asyncio
+import types
+import pytest
+from app.utils import async_cache
+from app.utils.async_cache import async_lru_cache
+
+
+def make_cached(results, **options):
+    calls = []
+
+    @async_lru_cache(**options)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        result = results[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch, calls
+
+
+def run_all(*coros):
+    async def main():
+        return [await coro for coro in coros]
+    return asyncio.run(main())
+
+
+def test_results_are_cached():
+    fetch, calls = make_cached({1: ["one"]})
+
+    assert run_all(fetch(1), fetch(1)) == [["one"], ["one"]]
+    assert calls == [1]
+
+
+def test_least_recently_used_is_evicted():
+    fetch, calls = make_cached({1: ["one"], 2: ["two"], 3: ["three"]}, maxsize=2)
+
+    run_all(fetch(1), fetch(2), fetch(1), fetch(3))
+    assert calls == [1, 2, 3]
+
+    run_all(fetch(1), fetch(2))
+    assert calls == [1, 2, 3, 2]
+
+
+def test_empty_results_are_not_cached():
+    fetch, calls = make_cached({1: []})
+
+    run_all(fetch(1), fetch(1))
+    assert calls == [1, 1]
+
+
+def test_exceptions_are_not_cached():
+    fetch, calls = make_cached({1: ValueError("upstream")})
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            run_all(fetch(1))
+    assert calls == [1, 1]
+
+
+def test_cache_clear():
+    fetch, calls = make_cached({1: ["one"]})
+
+    run_all(fetch(1))
+    fetch.cache_clear()
+    run_all(fetch(1))
+    assert calls == [1, 1]
+
+
+def test_results_expire_after_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(async_cache, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    fetch, calls = make_cached({1: ["one"]}, ttl=60)
+
+    run_all(fetch(1))
+    now[0] = 59
+    run_all(fetch(1))
+    assert calls == [1]
+
+    now[0] = 60
+    run_all(fetch(1))
+    assert calls == [1, 1]
+
+
+def test_concurrent_calls_share_one_call():
+    fetch, calls = make_cached({1: ["one"], 2: ["two"]})
+
+    async def main():
+        return await asyncio.gather(fetch(1), fetch(1), fetch(2), fetch(1))
+
+    assert asyncio.run(main()) == [["one"], ["one"], ["two"], ["one"]]
+    assert calls == [1, 2]
+
+
+def test_concurrent_calls_share_one_exception():
+    fetch, calls = make_cached({1: ValueError("upstream")})
+
+    async def main():
+        return await asyncio.gather(fetch(1), fetch(1), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == [1]
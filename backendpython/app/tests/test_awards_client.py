@@ -0,0 +1,42 @@
+import asyncio
+import httpx
+import pytest
+from app.clients import awards_client
+from app.clients.awards_client import get_oscar_category_details, get_oscar_edition_by_year
+
+
+@pytest.fixture
+def awards_api(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("/nominees"):
+            return httpx.Response(404, json={"error": "Not found"})
+        return httpx.Response(200, content=b'[{"id": 92, "year": 2020, "host": "None"}]')
+
+    get_oscar_edition_by_year.cache_clear()
+    get_oscar_category_details.cache_clear()
+    monkeypatch.setattr(awards_client, "_client", httpx.AsyncClient(
+        headers=awards_client._JSON_HEADERS,
+        transport=httpx.MockTransport(handler),
+    ))
+    yield requests
+    get_oscar_edition_by_year.cache_clear()
+    get_oscar_category_details.cache_clear()
+
+
+def test_success_body_is_decoded(awards_api):
+    editions = asyncio.run(get_oscar_edition_by_year(2020))
+
+    assert editions == [{"id": 92, "year": 2020, "host": "None"}]
+    assert awards_api[0].url.params["year"] == "2020"
+    assert awards_api[0].headers["accept"] == "application/json"
+
+
+def test_error_status_raises(awards_api):
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        asyncio.run(get_oscar_category_details(92, 2))
+
+    assert error.value.response.status_code == 404
+    assert "404" in str(error.value)
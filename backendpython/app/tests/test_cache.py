@@ -0,0 +1,110 @@
+import asyncio
+import datetime
+import httpx
+import orjson
+import pytest
+import redis.asyncio as redis
+from app.core import cache
+from app.core.cache import HISTORICAL_TTL, RECENT_TTL, cached, etag_for, ttl_for_year
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise redis.ConnectionError("Redis is down")
+
+    def pipeline(self, transaction=True):
+        raise redis.ConnectionError("Redis is down")
+
+
+def make_cached(results, **options):
+    calls = []
+
+    @cached("test", **options)
+    async def fetch(year):
+        calls.append(year)
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch, calls
+
+
+def test_cached_miss_then_hit(fake_redis):
+    fetch, calls = make_cached([{"year": 1990}])
+
+    assert asyncio.run(fetch(1990)) == {"year": 1990}
+    assert asyncio.run(fetch(1990)) == {"year": 1990}
+    assert calls == [1990]
+    assert orjson.loads(fake_redis.data["test:1990"]) == {"year": 1990}
+    assert fake_redis.ttls["test:1990"] == HISTORICAL_TTL
+    assert fake_redis.ttls["stale:test:1990"] is None
+    assert fake_redis.data["etag:test:1990"].decode() == etag_for(fake_redis.data["test:1990"])
+    assert fake_redis.ttls["etag:test:1990"] == HISTORICAL_TTL
+
+
+def test_cached_serves_stale_copy_on_http_error(fake_redis):
+    fake_redis.data["stale:test:1990"] = orjson.dumps({"year": 1990})
+    fetch, _ = make_cached([httpx.ConnectError("down")])
+
+    assert asyncio.run(fetch(1990)) == {"year": 1990}
+
+
+def test_cached_reraises_http_error_without_stale_copy(fake_redis):
+    fetch, _ = make_cached([httpx.ConnectError("down")])
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(fetch(1990))
+
+
+def test_cached_skips_write_when_should_cache_is_false(fake_redis):
+    fetch, calls = make_cached(
+        [{"artists": []}, {"artists": []}],
+        should_cache=lambda payload: bool(payload["artists"]),
+    )
+
+    asyncio.run(fetch(1990))
+    asyncio.run(fetch(1990))
+    assert calls == [1990, 1990]
+    assert fake_redis.data == {}
+
+
+def test_cached_skips_empty_results(fake_redis):
+    fetch, _ = make_cached([{}])
+
+    asyncio.run(fetch(1990))
+    assert fake_redis.data == {}
+
+
+def test_cached_redis_error_degrades_to_miss(monkeypatch):
+    monkeypatch.setattr(cache, "_redis", BrokenRedis())
+    fetch, calls = make_cached([{"year": 1990}, {"year": 1990}])
+
+    assert asyncio.run(fetch(1990)) == {"year": 1990}
+    assert asyncio.run(fetch(1990)) == {"year": 1990}
+    assert calls == [1990, 1990]
+
+
+def test_cached_rejects_extra_arguments(fake_redis):
+    fetch, calls = make_cached([{"year": 1990}])
+
+    with pytest.raises(TypeError):
+        asyncio.run(fetch(1990, 3))
+    with pytest.raises(TypeError):
+        asyncio.run(fetch(1990, limit=3))
+    assert calls == []
+
+
+def test_cached_accepts_year_as_keyword(fake_redis):
+    fetch, _ = make_cached([{"year": 1990}])
+
+    assert asyncio.run(fetch(year=1990)) == {"year": 1990}
+
+
+def test_ttl_for_year_boundaries():
+    this_year = datetime.date.today().year
+
+    assert ttl_for_year(this_year - 2) == HISTORICAL_TTL
+    assert ttl_for_year(this_year - 1) == RECENT_TTL
+    assert ttl_for_year(this_year) == RECENT_TTL
+    assert ttl_for_year(this_year + 1) == RECENT_TTL
@@ -0,0 +1,126 @@
+import pytest
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from app.core.cache import cached, etag_for
+from app.core.etag import etag_middleware
+
+PAYLOAD = {"year": 1990, "events_by_month": {"January": ["Event one."]}}
+
+
+@cached("year")
+async def fetch_year(year):
+    return dict(PAYLOAD, year=year)
+
+
+def build_app():
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.middleware("http")(etag_middleware)
+
+    @app.get("/api/v1/year/{year}")
+    async def get_year(year: int):
+        return await fetch_year(year)
+
+    @app.post("/api/v1/year/{year}")
+    async def post_year(year: int):
+        return {"year": year}
+
+    @app.get("/api/v1/year/{year}/awards")
+    async def get_awards(year: int):
+        raise HTTPException(status_code=404, detail="No Oscars")
+
+    @app.get("/api/v1/year/{year}/wiki")
+    async def get_wiki(year: int, response: Response):
+        response.set_cookie("first", "1")
+        response.set_cookie("second", "2")
+        return {"year": year}
+
+    @app.get("/api/v1/year/{year}/songs")
+    async def get_songs(year: int):
+        return {"year": year}
+
+    return app
+
+
+@pytest.fixture
+def client():
+    with TestClient(build_app()) as test_client:
+        yield test_client
+
+
+def test_etag_from_stored_payload_tag(client, fake_redis):
+    response = client.get("/api/v1/year/1990")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == fake_redis.data["etag:year:1990"].decode()
+    assert response.headers["etag"] == etag_for(response.content)
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+
+def test_304_on_matching_tag(client, fake_redis):
+    etag = client.get("/api/v1/year/1990").headers["etag"]
+
+    response = client.get("/api/v1/year/1990", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_304_on_weak_tag(client, fake_redis):
+    etag = client.get("/api/v1/year/1990").headers["etag"]
+
+    response = client.get("/api/v1/year/1990", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+
+def test_304_on_star(client, fake_redis):
+    client.get("/api/v1/year/1990")
+
+    response = client.get("/api/v1/year/1990", headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+
+
+def test_200_on_mismatching_tag(client, fake_redis):
+    response = client.get("/api/v1/year/1990", headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+    assert response.json()["year"] == 1990
+
+
+def test_etag_without_redis(client):
+    response = client.get("/api/v1/year/1990")
+    etag = response.headers["etag"]
+    assert etag == etag_for(response.content)
+
+    assert client.get("/api/v1/year/1990", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_non_get_passthrough(client, fake_redis):
+    response = client.post("/api/v1/year/1990", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_non_200_passthrough(client, fake_redis):
+    response = client.get("/api/v1/year/1990/awards", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
+
+
+def test_uncached_route_passthrough(client, fake_redis):
+    response = client.get("/api/v1/year/1990/songs", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
+    assert fake_redis.data == {}
+
+
+def test_repeated_headers_are_kept(client):
+    response = client.get("/api/v1/year/1990/wiki")
+
+    assert "etag" in response.headers
+    assert len(response.headers.get_list("set-cookie")) == 2
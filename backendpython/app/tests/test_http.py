@@ -0,0 +1,74 @@
+import asyncio
+import httpx
+import pytest
+from tenacity import wait_none
+from app.clients import artist_img_client, wiki_client
+from app.clients.wiki_client import fetch_year_wikitext
+from app.core.http import PerLoop
+
+
+def use_statuses(monkeypatch, statuses):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status = statuses[min(len(requests), len(statuses)) - 1]
+        return httpx.Response(status, json={"parse": {"wikitext": "== Events =="}})
+
+    monkeypatch.setattr(wiki_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return requests
+
+
+def fetch_without_backoff(year):
+    return asyncio.run(fetch_year_wikitext.retry_with(wait=wait_none())(year))
+
+
+def test_server_errors_are_retried_then_reraised(monkeypatch):
+    requests = use_statuses(monkeypatch, [503])
+
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        fetch_without_backoff(1997)
+    assert error.value.response.status_code == 503
+    assert len(requests) == 3
+
+
+def test_rate_limit_is_retried_until_success(monkeypatch):
+    requests = use_statuses(monkeypatch, [429, 503, 200])
+
+    assert fetch_without_backoff(1997) == "== Events =="
+    assert len(requests) == 3
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    requests = use_statuses(monkeypatch, [404])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch_without_backoff(1997)
+    assert len(requests) == 1
+
+
+def test_per_loop_primitive_works_across_event_loops():
+    lock = PerLoop(asyncio.Lock)
+
+    async def contend():
+        async def hold():
+            async with lock:
+                await asyncio.sleep(0)
+        await asyncio.gather(hold(), hold(), hold())
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+
+def test_image_lookups_are_not_retried(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    monkeypatch.setattr(artist_img_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(artist_img_client.fetch_wiki_image("Madonna"))
+    assert len(requests) == 1
@@ -0,0 +1,56 @@
+import asyncio
+import types
+import httpx
+import pytest
+from app.clients import music_client
+from app.clients.music_client import TOKEN_REFRESH_MARGIN, get_spotify_token
+
+
+@pytest.fixture
+def token_endpoint(monkeypatch):
+    now = [1000.0]
+    posts = []
+
+    async def handler(request):
+        posts.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"access_token": f"token-{len(posts)}", "expires_in": 3600})
+
+    monkeypatch.setattr(music_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(music_client, "_token_cache", None)
+    monkeypatch.setattr(music_client, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return posts, now
+
+
+def test_token_is_reused(token_endpoint):
+    posts, _ = token_endpoint
+
+    async def fetch_twice():
+        return await get_spotify_token(), await get_spotify_token()
+
+    assert asyncio.run(fetch_twice()) == ("token-1", "token-1")
+    assert len(posts) == 1
+    assert posts[0].headers["Authorization"].startswith("Basic ")
+
+
+def test_token_is_refreshed_before_expiry(token_endpoint):
+    posts, now = token_endpoint
+
+    assert asyncio.run(get_spotify_token()) == "token-1"
+
+    now[0] += 3600 - TOKEN_REFRESH_MARGIN - 1
+    assert asyncio.run(get_spotify_token()) == "token-1"
+
+    now[0] += 1
+    assert asyncio.run(get_spotify_token()) == "token-2"
+    assert len(posts) == 2
+
+
+def test_concurrent_callers_share_one_refresh(token_endpoint):
+    posts, _ = token_endpoint
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*[get_spotify_token() for _ in range(5)])
+
+    assert asyncio.run(fetch_concurrently()) == ["token-1"] * 5
+    assert len(posts) == 1
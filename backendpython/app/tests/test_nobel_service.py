@@ -0,0 +1,33 @@
+import asyncio
+import httpx
+from app.services import nobel_service
+from app.services.nobel_service import fetch_nobel_html
+
+
+def use_body(monkeypatch, chunks):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    def handler(request):
+        assert request.url.params["page"] == "1997_Nobel_Prizes"
+        return httpx.Response(200, content=stream())
+
+    monkeypatch.setattr(nobel_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def test_fetch_nobel_html_joins_chunks(monkeypatch):
+    use_body(monkeypatch, [
+        b'{"parse": {"title": "1997 Nobel Prizes", "te',
+        b'xt": "<h3>Physics</h3><table class=\\"wiki',
+        b'table\\"></table>"}}',
+    ])
+
+    html = asyncio.run(fetch_nobel_html(1997))
+    assert html == '<h3>Physics</h3><table class="wikitable"></table>'
+
+
+def test_fetch_nobel_html_without_parse(monkeypatch):
+    use_body(monkeypatch, [b'{"error": {"code": "missingtitle"}}'])
+
+    assert asyncio.run(fetch_nobel_html(1997)) == ""
@@ -0,0 +1,37 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.api.v1 import awards
+from app.main import app
+from app.utils.validate_year import MAX_YEAR, MIN_YEAR
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    async def fake_fetch_oscar_highlights(year):
+        calls.append(year)
+        return {"year": year, "oscars": {}, "source": "The Awards API"}
+
+    monkeypatch.setattr(awards, "fetch_oscar_highlights", fake_fetch_oscar_highlights)
+    with TestClient(app) as test_client:
+        yield test_client, calls
+
+
+@pytest.mark.parametrize("year", [MIN_YEAR - 1, MAX_YEAR + 1, "abc"])
+def test_out_of_range_year_is_rejected(client, year):
+    test_client, calls = client
+
+    response = test_client.get(f"/api/v1/year/{year}/awards")
+    assert response.status_code == 422
+    assert calls == []
+
+
+@pytest.mark.parametrize("year", [MIN_YEAR, 2020, MAX_YEAR])
+def test_in_range_year_reaches_handler(client, year):
+    test_client, calls = client
+
+    response = test_client.get(f"/api/v1/year/{year}/awards")
+    assert response.status_code == 200
+    assert response.json()["year"] == year
+    assert calls == [year]
@@ -0,0 +1,75 @@
+from app.utils.wiki_nobel_extractor import extract_nobel
+
+NOBEL_PAGE = """
+<div class="mw-parser-output">
+  <h2>Prizes</h2>
+  <h3>Physics</h3>
+  <table class="infobox">
+    <tr><td><img src="//upload.example.org/infobox.jpg"></td><td><a href="/wiki/Not_a_laureate">Not a laureate</a></td></tr>
+  </table>
+  <table class="wikitable sortable">
+    <tr><th>Image</th><th>Laureate</th><th>Country</th><th>Rationale</th></tr>
+    <tr>
+      <td><img src="//upload.example.org/first.jpg"></td>
+      <td><a href="/wiki/First">First <b>Laureate</b></a></td>
+      <td>Sweden</td>
+      <td rowspan="2">for <a href="/wiki/Discovery">their discovery</a> of something</td>
+    </tr>
+    <tr>
+      <td><img src="https://upload.example.org/second.jpg"></td>
+      <td><a href="/wiki/Second">Second Laureate</a></td>
+      <td>Norway</td>
+    </tr>
+    <tr>
+      <td></td>
+      <td>No link here</td>
+    </tr>
+  </table>
+  <h2>Economic Sciences</h2>
+  <h3>Literature</h3>
+  <table class="wikitable">
+    <tr>
+      <td></td>
+      <td><a href="/wiki/Writer">Writer</a></td>
+      <td>France</td>
+      <td>for his novels</td>
+    </tr>
+  </table>
+  <h3>Peace</h3>
+</div>
+"""
+
+
+def test_extract_nobel_parses_categories():
+    prizes = extract_nobel(NOBEL_PAGE)
+
+    assert list(prizes) == ["Physics", "Economic Sciences", "Literature"]
+    assert prizes["Physics"] == [
+        {
+            "name": "FirstLaureate",
+            "motivation": "for their discovery of something",
+            "image": "https://upload.example.org/first.jpg",
+        },
+        {
+            "name": "Second Laureate",
+            "motivation": "for their discovery of something",
+            "image": "https://upload.example.org/second.jpg",
+        },
+    ]
+
+
+def test_extract_nobel_shares_table_between_back_to_back_headings():
+    prizes = extract_nobel(NOBEL_PAGE)
+
+    expected = [{"name": "Writer", "motivation": "for his novels", "image": None}]
+    assert prizes["Economic Sciences"] == expected
+    assert prizes["Literature"] == expected
+
+
+def test_extract_nobel_skips_heading_without_table():
+    assert "Peace" not in extract_nobel(NOBEL_PAGE)
+
+
+def test_extract_nobel_empty_html():
+    assert extract_nobel("") == {}
+    assert extract_nobel("   \n") == {}
@@ -0,0 +1,87 @@
+import asyncio
+from app.core import cache
+from app.services import wiki_service
+from app.services.wiki_service import fetch_year_summary, split_month_sections
+
+YEAR_PAGE = """{{Year nav|1997}}
+'''1997''' was a common year starting on Wednesday.
+
+== Events ==
+=== January ===
+* [[January 1]] – Event one.
+* [[January 2]] – Event two.
+
+=== February ===
+==== February 4 ====
+* Day headed event.
+==== February 5 ====
+* Another day event.
+
+=== December ===
+* [[December 31]] – Last event.
+
+=== Date unknown ===
+* Undated event.
+
+== Births ==
+=== January ===
+* [[January 3]] – Someone is born.
+=== December ===
+* [[December 9]] – Someone else is born.
+
+== Deaths ==
+=== January ===
+* [[January 5]] – Someone dies.
+"""
+
+
+def test_split_month_sections_uses_events_months():
+    sections = split_month_sections(YEAR_PAGE)
+
+    assert list(sections) == ["January", "February", "December"]
+    assert "Event one." in sections["January"]
+    assert "Event two." in sections["January"]
+    assert "born" not in sections["January"]
+    assert "dies" not in sections["January"]
+
+
+def test_split_month_sections_keeps_day_subheadings():
+    february = split_month_sections(YEAR_PAGE)["February"]
+
+    assert "Day headed event." in february
+    assert "Another day event." in february
+
+
+def test_split_month_sections_ends_december_at_date_unknown():
+    december = split_month_sections(YEAR_PAGE)["December"]
+
+    assert "Last event." in december
+    assert "Undated event." not in december
+    assert "born" not in december
+
+
+def test_split_month_sections_top_level_months():
+    page = "== January ==\n* Event one.\n=== January 2 ===\n* Event two.\n== Births ==\n* Someone is born.\n"
+
+    assert split_month_sections(page) == {"January": "\n* Event one.\n=== January 2 ===\n* Event two.\n"}
+
+
+def test_split_month_sections_no_months():
+    assert split_month_sections("") == {}
+    assert split_month_sections("== Events ==\n* Undated event.\n") == {}
+
+
+def test_fetch_year_summary(monkeypatch):
+    async def fake_fetch_year_wikitext(year):
+        return YEAR_PAGE
+
+    monkeypatch.setattr(cache, "_redis", None)
+    monkeypatch.setattr(wiki_service, "fetch_year_wikitext", fake_fetch_year_wikitext)
+
+    summary = asyncio.run(fetch_year_summary(1997))
+
+    assert summary == {
+        "January": ["January 1 - Event one.", "January 2 - Event two."],
+        "February": ["Day headed event.", "Another day event."],
+        "December": ["December 31 - Last event."],
+    }
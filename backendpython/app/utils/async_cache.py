@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+
+
+def async_lru_cache(maxsize: int = 128, ttl: float | None = None):
+    """
+    In-process LRU cache for async functions.
+
+    `functools.lru_cache` cannot be used on coroutine functions since it would
+    cache the coroutine object, which can only be awaited once. This decorator
+    caches the awaited result instead, keyed by the positional arguments.
+    Empty results and exceptions are not cached, so data that is published
+    later (e.g. an upcoming ceremony) is still picked up. Concurrent calls
+    with the same arguments share a single in-flight call.
+
+    Cached results are shared between callers, like with `functools.lru_cache`,
+    so callers must not mutate them.
+
+    Args:
+        maxsize (int): Maximum number of cached results before the least
+            recently used one is evicted.
+        ttl (float | None): Seconds a result stays cached. None keeps results
+            until they are evicted.
+
+    Returns:
+        Callable: The decorator. The wrapped function gets a `cache_clear()`.
+    """
+    def decorator(func):
+        cache: OrderedDict = OrderedDict()
+        pending: dict[tuple, asyncio.Future] = {}
+
+        async def load(args):
+            try:
+                result = await func(*args)
+            finally:
+                del pending[args]
+
+            if result:
+                expires = time.monotonic() + ttl if ttl is not None else None
+                cache[args] = (result, expires)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            if args in cache:
+                result, expires = cache[args]
+                if expires is None or time.monotonic() < expires:
+                    cache.move_to_end(args)
+                    return result
+                del cache[args]
+
+            task = pending.get(args)
+            if task is None:
+                task = pending[args] = asyncio.ensure_future(load(args))
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
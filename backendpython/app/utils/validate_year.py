@@ -1,21 +1,13 @@
+from typing import Annotated
+from fastapi import Path
 
-from fastapi import HTTPException, status
+MIN_YEAR = 1800
+MAX_YEAR = 2027
 
-def validate_year(year: int):
-    """
-    Validate that the given year is within the range.
-    
-    Parameters
-    -----------
-        year: int
-            The year to validate
-    Raises
-    -------
-        HTTPException
-            If the year is outside the allowed range (1800 - 2027)  
-    """
-    if year < 1800 or year > 2027:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="BAD REQUEST: Year must be between 1800 and 2027"
-        )
\ No newline at end of file
+# Path parameter type for a year within the allowed range (1800 - 2027).
+# Declared on the route signature, so FastAPI rejects out-of-range years with
+# a 422 response before the endpoint body runs.
+Year = Annotated[
+    int,
+    Path(ge=MIN_YEAR, le=MAX_YEAR, description=f"Year between {MIN_YEAR} and {MAX_YEAR}"),
+]
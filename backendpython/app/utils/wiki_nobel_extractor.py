@@ -1,13 +1,36 @@
 
-from bs4 import BeautifulSoup
+import lxml.html
+
+NOBEL_CATEGORIES = {
+    "Physics",
+    "Chemistry",
+    "Physiology or Medicine",
+    "Literature",
+    "Peace",
+    "Economic Sciences"
+}
+
+
+def _text(element, separator: str = "") -> str:
+    """
+    Join the stripped text fragments of an element, skipping empty ones.
+    """
+    return separator.join(
+        fragment.strip() for fragment in element.itertext() if fragment.strip()
+    )
+
+
+def _is_wikitable(element) -> bool:
+    return "wikitable" in (element.get("class") or "").split()
 
 
 def extract_nobel(html: str) -> dict:
     """
     Extract Nobel Prize laureates from the HTML of a Wikipedia Nobel Prize page.
 
-    The function looks for headings matching standard Nobel categories and
-    then parses the following wikitable to extract:
+    The function walks the document once in order. Headings matching standard
+    Nobel categories are remembered until the next wikitable, which is then
+    parsed to extract:
     - Laureate names
     - Motivations
     - Image URLs (if available)
@@ -28,56 +51,68 @@ def extract_nobel(html: str) -> dict:
 
 
     """
+    if not html or not html.strip():
+        return {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    tree = lxml.html.fromstring(html)
     prizes = {}
+    pending_titles = []
 
-    for header in soup.find_all(['h2', 'h3']):
-        title = header.get_text(strip = True)
-
-        if title not in {
-            "Physics",
-            "Chemistry",
-            "Physiology or Medicine",
-            "Literature",
-            "Peace",
-            "Economic Sciences"
-        }:
+    for element in tree.iter("h2", "h3", "table"):
+        if element.tag != "table":
+            title = _text(element)
+            if title in NOBEL_CATEGORIES:
+                pending_titles.append(title)
             continue
 
-        table = header.find_next("table", class_ = "wikitable")
-        if not table:
+        if not pending_titles or not _is_wikitable(element):
             continue
 
-        laureates = []
-        motivation = None
+        laureates = parse_laureate_table(element)
+        for title in pending_titles:
+            prizes[title] = laureates
+        pending_titles = []
 
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) < 2:
-                continue
+    return prizes
 
-            if len(cells) >= 4:
-                motivation = cells[3].get_text(" ",strip = True)
 
-            name = cells[1].find("a")
-            if not name:
-                continue
+def parse_laureate_table(table) -> list[dict]:
+    """
+    Parse the laureates of a single Nobel category wikitable.
 
-            img_tag = cells[0].find("img")
-            image_url = None
-            if img_tag and img_tag.get("src"):
-                image_url = img_tag["src"]
-                if image_url.startswith("//"):
-                    image_url = "https:" + image_url
+    Args:
+        table (lxml.html.HtmlElement): The wikitable following a category heading.
 
+    Returns:
+        list[dict]: Laureate dicts with "name", "motivation" and "image".
+    """
+    laureates = []
+    motivation = None
 
-            laureates.append({
-                "name": name.get_text(strip = True),
-                "motivation": motivation,
-                "image": image_url
-            })
+    for row in table.iter("tr"):
+        cells = list(row.iter("td"))
+        if len(cells) < 2:
+            continue
 
-        prizes[title] = laureates
+        if len(cells) >= 4:
+            motivation = _text(cells[3], " ")
 
-    return prizes
+        name = next(cells[1].iter("a"), None)
+        if name is None:
+            continue
+
+        img_tag = next(cells[0].iter("img"), None)
+        image_url = None
+        if img_tag is not None and img_tag.get("src"):
+            image_url = img_tag.get("src")
+            if image_url.startswith("//"):
+                image_url = "https:" + image_url
+
+
+        laureates.append({
+            "name": _text(name),
+            "motivation": motivation,
+            "image": image_url
+        })
+
+    return laureates
@@ -0,0 +1,12 @@
+"""Pytest setup for the backend.
+
+`app.core.config` refuses to import without the external API keys, and
+importing any `app` module imports the whole application. Dummy values are
+provided so the tests can run without credentials; keys already set in the
+environment take precedence.
+"""
+
+import os
+
+for key in ("TMDB_API_KEY", "LASTFM_API_KEY", "SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET"):
+    os.environ.setdefault(key, "test")